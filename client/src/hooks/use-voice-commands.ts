@@ -167,35 +167,21 @@ export function useVoiceCommands({
       if (parsedCommand.type === 'order' && parsedCommand.items?.length) {
         logger.info('Processing drink order:', parsedCommand.items);
 
-        for (const item of parsedCommand.items) {
-          const matchedDrink = drinks.find(
-            d => d.name.toLowerCase() === item.name.toLowerCase()
+        // The parser already resolved each item against the menu, so use
+        // its match instead of scanning the drinks list again
+        for (const { drink, quantity } of parsedCommand.items) {
+          await onAddToCart({
+            type: 'ADD_ITEM',
+            drink,
+            quantity
+          });
+          voiceAnalytics.trackCommand('drink_order', true, {
+            command: `${quantity} ${drink.name}`
+          });
+          showFeedback(
+            'Added to Cart',
+            `Added ${quantity} ${drink.name}(s) to your cart.`
           );
-
-          if (matchedDrink) {
-            await onAddToCart({
-              type: 'ADD_ITEM',
-              drink: matchedDrink,
-              quantity: item.quantity
-            });
-            voiceAnalytics.trackCommand('drink_order', true, {
-              command: `${item.quantity} ${matchedDrink.name}`
-            });
-            showFeedback(
-              'Added to Cart',
-              `Added ${item.quantity} ${matchedDrink.name}(s) to your cart.`
-            );
-          } else {
-            voiceAnalytics.trackCommand('drink_order', false, {
-              command: text,
-              error: 'Drink not found'
-            });
-            showFeedback(
-              'Error',
-              `Sorry, I couldn't find "${item.name}" in our menu.`,
-              'destructive'
-            );
-          }
         }
       }
     } catch (error) {
@@ -7,10 +7,49 @@ type ParsedCommand = {
     name: string;
     quantity: number;
     modifiers?: string[];
+    drink: DrinkItem;
   }>;
   action?: string;
 };
 
+// Patterns are compiled once at module load instead of on every command
+const FILLER_PREFIX_PATTERN = /(?:can|could|would|like|want|get|have|give|make|add|pour|bring|serve)\s+(me|us|i|a|an|some|to)?\s*/g;
+const POLITENESS_PATTERN = /\b(please|thanks|thank you)\b/g;
+
+// Enhanced patterns for order completion
+const COMPLETE_ORDER_PATTERNS = [
+  // Direct completion commands
+  /^(?:complete|process|finish|confirm|place|submit)\s*(?:my|the|this)?\s*order$/i,
+  /^(?:that'?s?\s*(?:it|all)|done|ready|checkout|good|perfect)$/i,
+  /^(?:process|complete|handle)\s*(?:my|the)?\s*payment$/i,
+  /^(?:pay|checkout|finalize|ring)\s*(?:me|this|up|now|order)?$/i,
+  /^(?:order|payment)\s*(?:complete|done|finished)$/i,
+  // Natural language variations
+  /^(?:i'?m?\s*)?(?:ready|done|finished|good)(?:\s*(?:now|with\s*(?:my\s*)?order))?$/i,
+  /^(?:i'?d?\s*like\s*to|can\s*(?:you|we)|could\s*(?:you|we))?\s*(?:place|submit|send|process)\s*(?:my|the|this)?\s*order(?:\s*now|please)?$/i,
+  /^(?:let'?s?\s*)?(?:check|ring|cash)\s*(?:me|this)?\s*out(?:\s*now)?$/i,
+  /^(?:i'?m?\s*)?(?:all\s*set|ready\s*to\s*pay|done\s*ordering)$/i,
+  /^(?:that'?s?\s*)?(?:everything|all\s*i\s*need|all\s*for\s*(?:me|now|today))$/i
+];
+
+// Enhanced system commands
+const SYSTEM_COMMANDS = {
+  help: /^(?:help|what can (?:i|you) (?:say|do)|show (?:me )?(?:the )?(?:commands|menu)|how does this work)/i,
+  cancel: /^(?:cancel|clear|remove|delete|start over|scratch that)\s+(?:order|everything|all|that)/i
+};
+
+const QUANTITY_PATTERN = /(\d+|a|one|two|three|four|five|couple|few)\s+(.+)/i;
+const QUANTITY_WORDS: Record<string, number> = {
+  'a': 1, 'one': 1, 'two': 2, 'three': 3, 'four': 4, 'five': 5, 'couple': 2, 'few': 3
+};
+
+const MODIFIER_PATTERNS = [
+  'diet', 'light', 'sugar[- ]free', 'double', 'triple',
+  'with ice', 'no ice', 'neat', 'on the rocks',
+  'extra', 'less', 'splash of', 'twist of', 'with',
+  'chilled', 'frozen', 'hot', 'warm'
+].map(pattern => ({ pattern, regex: new RegExp(pattern, 'i') }));
+
 // Normalized drink name matching with improved fuzzy matching
 function normalizeText(text: string): string {
   return text.toLowerCase()
@@ -19,30 +58,45 @@ function normalizeText(text: string): string {
     .trim();
 }
 
+// Normalized menu names, cached per drinks array. The menu array is stable
+// between commands (it comes from the query cache), so names are normalized
+// once per menu rather than for every order fragment of every command.
+const normalizedNameCache = new WeakMap<DrinkItem[], string[]>();
+
+function getNormalizedNames(availableDrinks: DrinkItem[]): string[] {
+  let names = normalizedNameCache.get(availableDrinks);
+  if (!names) {
+    names = availableDrinks.map(d => normalizeText(d.name));
+    normalizedNameCache.set(availableDrinks, names);
+  }
+  return names;
+}
+
 // Enhanced drink matching with fuzzy search
 function findMatchingDrink(drinkName: string, availableDrinks: DrinkItem[]): DrinkItem | null {
   const normalizedInput = normalizeText(drinkName);
 
   // Remove common filler words
   const cleanedInput = normalizedInput
-    .replace(/(?:can|could|would|like|want|get|have|give|make|add|pour|bring|serve)\s+(me|us|i|a|an|some|to)?\s*/g, '')
-    .replace(/\b(please|thanks|thank you)\b/g, '')
+    .replace(FILLER_PREFIX_PATTERN, '')
+    .replace(POLITENESS_PATTERN, '')
     .trim();
 
+  const normalizedNames = getNormalizedNames(availableDrinks);
+
   // Try exact match first
-  const exactMatch = availableDrinks.find(d => 
-    normalizeText(d.name) === cleanedInput
-  );
+  const exactIndex = normalizedNames.indexOf(cleanedInput);
 
-  if (exactMatch) {
+  if (exactIndex !== -1) {
+    const exactMatch = availableDrinks[exactIndex];
     logger.info('Found exact drink match:', exactMatch.name);
     return exactMatch;
   }
 
   // Try partial matches with word boundaries
-  const partialMatches = availableDrinks.filter(d => {
-    const drinkName = normalizeText(d.name);
-    const words = cleanedInput.split(' ');
+  const words = cleanedInput.split(' ');
+  const partialMatches = availableDrinks.filter((_, index) => {
+    const drinkName = normalizedNames[index];
     return words.every(word => drinkName.includes(word)) ||
            drinkName.split(' ').some(word => cleanedInput.includes(word));
   });
@@ -76,37 +130,15 @@ export function parseVoiceCommand(text: string, availableDrinks: DrinkItem[]): P
     drinksAvailable: availableDrinks.length
   });
 
-  // Enhanced patterns for order completion
-  const completeOrderPatterns = [
-    // Direct completion commands
-    /^(?:complete|process|finish|confirm|place|submit)\s*(?:my|the|this)?\s*order$/i,
-    /^(?:that'?s?\s*(?:it|all)|done|ready|checkout|good|perfect)$/i,
-    /^(?:process|complete|handle)\s*(?:my|the)?\s*payment$/i,
-    /^(?:pay|checkout|finalize|ring)\s*(?:me|this|up|now|order)?$/i,
-    /^(?:order|payment)\s*(?:complete|done|finished)$/i,
-    // Natural language variations
-    /^(?:i'?m?\s*)?(?:ready|done|finished|good)(?:\s*(?:now|with\s*(?:my\s*)?order))?$/i,
-    /^(?:i'?d?\s*like\s*to|can\s*(?:you|we)|could\s*(?:you|we))?\s*(?:place|submit|send|process)\s*(?:my|the|this)?\s*order(?:\s*now|please)?$/i,
-    /^(?:let'?s?\s*)?(?:check|ring|cash)\s*(?:me|this)?\s*out(?:\s*now)?$/i,
-    /^(?:i'?m?\s*)?(?:all\s*set|ready\s*to\s*pay|done\s*ordering)$/i,
-    /^(?:that'?s?\s*)?(?:everything|all\s*i\s*need|all\s*for\s*(?:me|now|today))$/i
-  ];
-
   // Check for order completion first
-  for (const pattern of completeOrderPatterns) {
+  for (const pattern of COMPLETE_ORDER_PATTERNS) {
     if (pattern.test(textLower)) {
       logger.info('Matched complete order command');
       return { type: 'system', action: 'complete_order' };
     }
   }
 
-  // Enhanced system commands
-  const systemCommands = {
-    help: /^(?:help|what can (?:i|you) (?:say|do)|show (?:me )?(?:the )?(?:commands|menu)|how does this work)/i,
-    cancel: /^(?:cancel|clear|remove|delete|start over|scratch that)\s+(?:order|everything|all|that)/i
-  };
-
-  for (const [action, pattern] of Object.entries(systemCommands)) {
+  for (const [action, pattern] of Object.entries(SYSTEM_COMMANDS)) {
     if (pattern.test(textLower)) {
       logger.info('System command matched:', action);
       return { type: 'system', action };
@@ -124,16 +156,16 @@ export function parseVoiceCommand(text: string, availableDrinks: DrinkItem[]): P
 
   for (const part of orderParts) {
     // Skip if it looks like a system command
-    if (completeOrderPatterns.some(pattern => pattern.test(part))) {
+    if (COMPLETE_ORDER_PATTERNS.some(pattern => pattern.test(part))) {
       continue;
     }
 
     // Enhanced quantity extraction
-    const quantityMatch = part.match(/(\d+|a|one|two|three|four|five|couple|few)\s+(.+)/i);
+    const quantityMatch = part.match(QUANTITY_PATTERN);
     if (quantityMatch) {
       const [_, quantityStr, drinkName] = quantityMatch;
       const quantity = parseInt(quantityStr) || 
-                      { 'a': 1, 'one': 1, 'two': 2, 'three': 3, 'four': 4, 'five': 5, 'couple': 2, 'few': 3 }[quantityStr.toLowerCase()] || 
+                      QUANTITY_WORDS[quantityStr.toLowerCase()] || 
                       1;
 
       const matchedDrink = findMatchingDrink(drinkName, availableDrinks);
@@ -141,7 +173,8 @@ export function parseVoiceCommand(text: string, availableDrinks: DrinkItem[]): P
         items.push({
           name: matchedDrink.name,
           quantity,
-          modifiers: extractModifiers(drinkName)
+          modifiers: extractModifiers(drinkName),
+          drink: matchedDrink
         });
       }
     } else {
@@ -151,7 +184,8 @@ export function parseVoiceCommand(text: string, availableDrinks: DrinkItem[]): P
         items.push({
           name: matchedDrink.name,
           quantity: 1,
-          modifiers: extractModifiers(part)
+          modifiers: extractModifiers(part),
+          drink: matchedDrink
         });
       }
     }
@@ -167,20 +201,7 @@ export function parseVoiceCommand(text: string, availableDrinks: DrinkItem[]): P
 }
 
 function extractModifiers(itemName: string): string[] {
-  const modifiers: string[] = [];
-  const modifierPatterns = [
-    'diet', 'light', 'sugar[- ]free', 'double', 'triple',
-    'with ice', 'no ice', 'neat', 'on the rocks',
-    'extra', 'less', 'splash of', 'twist of', 'with',
-    'chilled', 'frozen', 'hot', 'warm'
-  ];
-
-  modifierPatterns.forEach(pattern => {
-    const regex = new RegExp(pattern, 'i');
-    if (regex.test(itemName)) {
-      modifiers.push(pattern);
-    }
-  });
-
-  return modifiers;
+  return MODIFIER_PATTERNS
+    .filter(({ regex }) => regex.test(itemName))
+    .map(({ pattern }) => pattern);
 }
\ No newline at end of file
@@ -1,2 +0,0 @@
-// This file has been removed as part of streamlining the application
-// Dashboard-specific voice commands have been removed
\ No newline at end of file
@@ -3,18 +3,21 @@ type LogLevel = 'info' | 'warn' | 'error' | 'debug';
 
 export const logger = {
   log: (level: LogLevel, message: string, context?: any) => {
-    const timestamp = new Date().toISOString();
+    // Bail out before building the entry; outside development it is never
+    // printed and serializing the context is the expensive part
+    if (process.env.NODE_ENV !== 'development') {
+      return;
+    }
+
     const logEntry = {
-      timestamp,
+      timestamp: new Date().toISOString(),
       level,
       message,
       context: context || {},
     };
-    
-    if (process.env.NODE_ENV === 'development') {
-      console.log(JSON.stringify(logEntry, null, 2));
-    }
-    
+
+    console.log(JSON.stringify(logEntry, null, 2));
+
     // Could add remote logging service integration here
   },
   info: (message: string, context?: any) => logger.log('info', message, context),
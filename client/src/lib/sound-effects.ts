@@ -1,9 +1,90 @@
 // Sound effects using Web Audio API with enhanced ambient audio feedback
+interface ToneOptions {
+  type?: OscillatorType;
+  attack?: number;
+  decay?: number;
+  sustain?: number;
+  release?: number;
+  detune?: number;
+}
+
+interface Tone {
+  frequency: number;
+  duration: number;
+  start: number; // offset in seconds from the beginning of the cue
+  options?: ToneOptions;
+}
+
+type CueName = 'wakeWord' | 'success' | 'listeningStart' | 'listeningStop';
+
+// The full, finite set of UI cues. Each one is rendered to an AudioBuffer
+// once and replayed from that buffer afterwards.
+const CUES: Record<CueName, Tone[]> = {
+  // Pleasant ascending major third
+  wakeWord: [
+    { frequency: 440, duration: 0.08, start: 0, options: { // A4
+      type: 'sine',
+      attack: 0.02,
+      decay: 0.01,
+      sustain: 0.8,
+      release: 0.02
+    } },
+    { frequency: 554.37, duration: 0.1, start: 0.1, options: { // C#5
+      type: 'sine',
+      attack: 0.01,
+      decay: 0.02,
+      sustain: 0.7,
+      release: 0.03
+    } }
+  ],
+  // Pleasant major chord with slight arpeggio
+  success: [
+    { frequency: 440.00, duration: 0.15, start: 0, options: { // A4
+      type: 'sine',
+      attack: 0.02,
+      sustain: 0.8,
+    } },
+    { frequency: 554.37, duration: 0.15, start: 0, options: { // C#5
+      type: 'sine',
+      attack: 0.03,
+      sustain: 0.7,
+      detune: -2
+    } },
+    { frequency: 659.25, duration: 0.15, start: 0, options: { // E5
+      type: 'sine',
+      attack: 0.04,
+      sustain: 0.6,
+      detune: 2
+    } }
+  ],
+  // Single gentle tone
+  listeningStart: [
+    { frequency: 554.37, duration: 0.08, start: 0, options: { // C#5
+      type: 'sine',
+      attack: 0.02,
+      decay: 0.01,
+      sustain: 0.8,
+      release: 0.02
+    } }
+  ],
+  // Gentle descending tone
+  listeningStop: [
+    { frequency: 440.00, duration: 0.1, start: 0, options: { // A4
+      type: 'sine',
+      attack: 0.02,
+      decay: 0.02,
+      sustain: 0.7,
+      release: 0.03
+    } }
+  ]
+};
+
 class SoundEffects {
   private static instance: SoundEffects;
   private audioContext: AudioContext | null = null;
   private masterGain: GainNode | null = null;
   private compressor: DynamicsCompressorNode | null = null;
+  private cueBuffers = new Map<CueName, Promise<AudioBuffer>>();
 
   private constructor() {
     // Initialize on first user interaction to comply with autoplay policies
@@ -35,6 +116,8 @@ class SoundEffects {
       this.compressor.connect(this.audioContext.destination);
 
       console.log('Audio context initialized successfully');
+
+      this.prerenderCues();
     } catch (error) {
       console.error('Failed to initialize audio context:', error);
     }
@@ -47,125 +130,105 @@ class SoundEffects {
     return SoundEffects.instance;
   }
 
-  private async playTone(
-    frequency: number,
-    duration: number,
-    options: {
-      type?: OscillatorType;
-      attack?: number;
-      decay?: number;
-      sustain?: number;
-      release?: number;
-      detune?: number;
-    } = {}
-  ) {
-    if (!this.audioContext || !this.masterGain) {
-      await this.initAudioContext();
+  // Pre-render every cue so the first play doesn't pay for rendering
+  private prerenderCues() {
+    (Object.keys(CUES) as CueName[]).forEach(name => {
+      this.getCueBuffer(name).catch(error => {
+        console.error(`Failed to pre-render ${name} sound:`, error);
+      });
+    });
+  }
+
+  private getCueBuffer(name: CueName): Promise<AudioBuffer> {
+    let buffer = this.cueBuffers.get(name);
+    if (!buffer) {
+      buffer = this.renderCue(CUES[name]).catch(error => {
+        // Allow a later play to retry the render
+        this.cueBuffers.delete(name);
+        throw error;
+      });
+      this.cueBuffers.set(name, buffer);
     }
+    return buffer;
+  }
 
-    const {
-      type = 'sine',
-      attack = 0.01,
-      decay = 0.03,
-      sustain = 0.7,
-      release = 0.03,
-      detune = 0
-    } = options;
+  private renderCue(tones: Tone[]): Promise<AudioBuffer> {
+    const sampleRate = this.audioContext!.sampleRate;
+    const length = Math.max(...tones.map(tone => tone.start + tone.duration));
+    const offlineContext = new OfflineAudioContext(1, Math.ceil(length * sampleRate), sampleRate);
 
-    try {
-      const oscillator = this.audioContext!.createOscillator();
-      const gainNode = this.audioContext!.createGain();
+    tones.forEach(({ frequency, duration, start, options = {} }) => {
+      const {
+        type = 'sine',
+        attack = 0.01,
+        decay = 0.03,
+        sustain = 0.7,
+        release = 0.03,
+        detune = 0
+      } = options;
+
+      const oscillator = offlineContext.createOscillator();
+      const gainNode = offlineContext.createGain();
 
       oscillator.connect(gainNode);
-      gainNode.connect(this.masterGain!);
+      gainNode.connect(offlineContext.destination);
 
       oscillator.type = type;
-      oscillator.frequency.setValueAtTime(frequency, this.audioContext!.currentTime);
-      oscillator.detune.setValueAtTime(detune, this.audioContext!.currentTime);
+      oscillator.frequency.setValueAtTime(frequency, start);
+      oscillator.detune.setValueAtTime(detune, start);
 
-      const now = this.audioContext!.currentTime;
-      gainNode.gain.setValueAtTime(0, now);
-      gainNode.gain.linearRampToValueAtTime(1, now + attack);
-      gainNode.gain.linearRampToValueAtTime(sustain, now + attack + decay);
-      gainNode.gain.linearRampToValueAtTime(sustain, now + duration - release);
-      gainNode.gain.linearRampToValueAtTime(0, now + duration);
+      gainNode.gain.setValueAtTime(0, start);
+      gainNode.gain.linearRampToValueAtTime(1, start + attack);
+      gainNode.gain.linearRampToValueAtTime(sustain, start + attack + decay);
+      gainNode.gain.linearRampToValueAtTime(sustain, start + duration - release);
+      gainNode.gain.linearRampToValueAtTime(0, start + duration);
 
-      oscillator.start(now);
-      oscillator.stop(now + duration);
+      oscillator.start(start);
+      oscillator.stop(start + duration);
+    });
+
+    return offlineContext.startRendering();
+  }
 
+  private async playCue(name: CueName) {
+    if (!this.audioContext || !this.masterGain) {
+      await this.initAudioContext();
+    }
+
+    try {
+      const buffer = await this.getCueBuffer(name);
+      const source = this.audioContext!.createBufferSource();
+      source.buffer = buffer;
+      source.connect(this.masterGain!);
+      source.start();
+
+      // Resolve on a timer rather than onended, which never fires while the
+      // context is suspended by the autoplay policy
       return new Promise<void>(resolve => {
         setTimeout(() => {
-          oscillator.disconnect();
-          gainNode.disconnect();
+          source.disconnect();
           resolve();
-        }, duration * 1000 + 20); // Minimal cleanup delay
+        }, buffer.duration * 1000 + 20); // Minimal cleanup delay
       });
     } catch (error) {
-      console.error('Error playing tone:', error);
+      console.error('Error playing sound effect:', error);
     }
   }
 
   async playWakeWord() {
-    // Pleasant ascending major third
-    await this.playTone(440, 0.08, { // A4
-      type: 'sine',
-      attack: 0.02,
-      decay: 0.01,
-      sustain: 0.8,
-      release: 0.02
-    });
-    await this.playTone(554.37, 0.1, { // C#5
-      type: 'sine',
-      attack: 0.01,
-      decay: 0.02,
-      sustain: 0.7,
-      release: 0.03
-    });
+    await this.playCue('wakeWord');
   }
 
   async playSuccess() {
-    // Pleasant major chord with slight arpeggio
-    await Promise.all([
-      this.playTone(440.00, 0.15, { // A4
-        type: 'sine',
-        attack: 0.02,
-        sustain: 0.8,
-      }),
-      this.playTone(554.37, 0.15, { // C#5
-        type: 'sine',
-        attack: 0.03,
-        sustain: 0.7,
-        detune: -2
-      }),
-      this.playTone(659.25, 0.15, { // E5
-        type: 'sine',
-        attack: 0.04,
-        sustain: 0.6,
-        detune: 2
-      })
-    ]);
+    await this.playCue('success');
   }
 
   async playListeningStart() {
-    // Single gentle tone
-    await this.playTone(554.37, 0.08, { // C#5
-      type: 'sine',
-      attack: 0.02,
-      decay: 0.01,
-      sustain: 0.8,
-      release: 0.02
-    });
+    await this.playCue('listeningStart');
   }
 
   async playListeningStop() {
-    // Gentle descending tone
-    await this.playTone(440.00, 0.1, { // A4
-      type: 'sine',
-      attack: 0.02,
-      decay: 0.02,
-      sustain: 0.7,
-      release: 0.03
-    });
+    await this.playCue('listeningStop');
   }
 }
 
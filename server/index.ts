@@ -17,16 +17,23 @@ app.use((req, res, next) => {
 });
 
 // Request logging middleware
+// Response bodies are only captured in development: serializing every API
+// payload is costly on the hot path and would write secrets such as the
+// /api/config key to production logs
+const logResponseBodies = app.get("env") === "development";
+
 app.use((req, res, next) => {
   const start = Date.now();
   const path = req.path;
 
-  // Capture the response for logging
-  const originalJson = res.json;
-  res.json = function(body) {
-    res.locals.body = body;
-    return originalJson.call(this, body);
-  };
+  if (logResponseBodies) {
+    // Capture the response for logging
+    const originalJson = res.json;
+    res.json = function(body) {
+      res.locals.body = body;
+      return originalJson.call(this, body);
+    };
+  }
 
   res.on('finish', () => {
     const duration = Date.now() - start;
@@ -36,7 +43,7 @@ app.use((req, res, next) => {
         path,
         status: res.statusCode,
         duration: `${duration}ms`,
-        response: res.locals.body
+        ...(logResponseBodies && { response: res.locals.body })
       };
       log(`API ${JSON.stringify(logData)}`);
     }
@@ -11,7 +11,7 @@ import {
   splitPayments,
   taxCategories
 } from "@db/schema";
-import { eq, sql } from "drizzle-orm";
+import { eq, inArray, sql } from "drizzle-orm";
 import { setupRealtimeProxy, broadcastUpdate } from "./realtime-proxy";
 import { PaymentService } from "./services/payments";
 
@@ -44,56 +44,49 @@ export function registerRoutes(app: Express): Server {
         });
       }
 
-      // Fetch drinks with their tax categories to calculate tax
-      const drinksWithTax = await Promise.all(
-        items.map(async (item: any) => {
-          const [drink] = await db
-            .select({
-              id: drinks.id,
-              name: drinks.name,
-              tax_category_id: drinks.tax_category_id,
-              inventory: drinks.inventory
-            })
-            .from(drinks)
-            .leftJoin(taxCategories, eq(drinks.tax_category_id, taxCategories.id))
-            .where(eq(drinks.id, item.drink_id));
-
-          return {
-            ...item,
-            drink,
-            available: drink && drink.inventory >= item.quantity
-          };
+      // Fetch all ordered drinks with their tax rates in a single query
+      const drinkIds = Array.from(new Set<number>(items.map((item: any) => Number(item.drink_id))));
+      const drinkRows = await db
+        .select({
+          id: drinks.id,
+          name: drinks.name,
+          tax_category_id: drinks.tax_category_id,
+          inventory: drinks.inventory,
+          tax_rate: taxCategories.rate
         })
+        .from(drinks)
+        .leftJoin(taxCategories, eq(drinks.tax_category_id, taxCategories.id))
+        .where(inArray(drinks.id, drinkIds));
+
+      const drinksById = new Map(
+        drinkRows.map(({ tax_rate, ...drink }) => [drink.id, { drink, taxRate: Number(tax_rate ?? 0) }])
       );
 
+      const drinksWithTax = items.map((item: any) => {
+        const row = drinksById.get(Number(item.drink_id));
+        return {
+          ...item,
+          drink: row?.drink,
+          taxRate: row?.taxRate ?? 0,
+          available: row && row.drink.inventory >= item.quantity
+        };
+      });
+
       // Check inventory
       const unavailableItems = drinksWithTax.filter(item => !item.available);
       if (unavailableItems.length > 0) {
         return res.status(400).json({
           success: false,
           error: "Some items are out of stock",
-          items: unavailableItems
+          items: unavailableItems.map(({ taxRate, ...item }) => item)
         });
       }
 
       // Calculate tax amounts for each item and total tax
-      const itemsWithTax = await Promise.all(
-        drinksWithTax.map(async (item) => {
-          const [taxCategory] = item.drink.tax_category_id 
-            ? await db
-                .select({ rate: taxCategories.rate })
-                .from(taxCategories)
-                .where(eq(taxCategories.id, item.drink.tax_category_id))
-            : [{ rate: 0 }];
-
-          const itemTaxAmount = Math.round(item.price * item.quantity * Number(taxCategory.rate));
-
-          return {
-            ...item,
-            tax_amount: itemTaxAmount
-          };
-        })
-      );
+      const itemsWithTax = drinksWithTax.map(({ taxRate, ...item }) => ({
+        ...item,
+        tax_amount: Math.round(item.price * item.quantity * taxRate)
+      }));
 
       const totalTaxAmount = itemsWithTax.reduce((sum, item) => sum + item.tax_amount, 0);
       const orderTotal = subtotal + totalTaxAmount;
@@ -279,26 +272,29 @@ export function registerRoutes(app: Express): Server {
         return res.status(400).json({ error: "Items must be an array" });
       }
 
-      const inventoryChecks = await Promise.all(
-        items.map(async (item: any) => {
-          const [drink] = await db
+      const drinkIds = Array.from(new Set<number>(items.map((item: any) => Number(item.drink_id))));
+      const drinkRows = drinkIds.length
+        ? await db
             .select({
               id: drinks.id,
               name: drinks.name,
               inventory: drinks.inventory
             })
             .from(drinks)
-            .where(eq(drinks.id, item.drink_id))
-            .limit(1);
-
-          return {
-            drink_id: item.drink_id,
-            requested_quantity: item.quantity,
-            available_quantity: drink?.inventory || 0,
-            is_available: drink && drink.inventory >= item.quantity
-          };
-        })
-      );
+            .where(inArray(drinks.id, drinkIds))
+        : [];
+      const drinksById = new Map(drinkRows.map(drink => [drink.id, drink]));
+
+      const inventoryChecks = items.map((item: any) => {
+        const drink = drinksById.get(Number(item.drink_id));
+
+        return {
+          drink_id: item.drink_id,
+          requested_quantity: item.quantity,
+          available_quantity: drink?.inventory || 0,
+          is_available: drink && drink.inventory >= item.quantity
+        };
+      });
 
       res.json({
         inventory_status: inventoryChecks,
@@ -332,48 +328,31 @@ export function registerRoutes(app: Express): Server {
     }
   });
 
+  // Resolve the OpenAI key once at startup; the environment does not change
+  // while the process is running, so config requests only read these values
+  const openaiKey = process.env.OPENAI_API_KEY?.trim();
+  const openaiKeyError = !openaiKey
+    ? "OpenAI API key not found in environment"
+    : !openaiKey.startsWith('sk-')
+      ? "Invalid OpenAI API key format"
+      : null;
+
   // Get OpenAI API configuration
   app.get("/api/config", (_req, res) => {
     res.setHeader('Content-Type', 'application/json');
-    
-    try {
-      const openaiKey = process.env.OPENAI_API_KEY?.trim();
-
-      if (!openaiKey) {
-        return res.status(500).json({
-          error: "Configuration error",
-          message: "OpenAI API key not found in environment",
-          timestamp: new Date().toISOString()
-        });
-      }
-
-      if (!openaiKey.startsWith('sk-')) {
-        return res.status(500).json({
-          error: "Configuration error",
-          message: "Invalid OpenAI API key format",
-          timestamp: new Date().toISOString()
-        });
-      }
-
-      return res.status(200).json({
-        openaiKey,
-        timestamp: new Date().toISOString()
-      });
-
-    } catch (error: unknown) {
-      const err = error as Error;
-      console.error("OpenAI config error:", {
-        message: err.message,
-        stack: err.stack,
-        timestamp: new Date().toISOString()
-      });
 
+    if (openaiKeyError) {
       return res.status(500).json({
         error: "Configuration error",
-        message: err.message,
+        message: openaiKeyError,
         timestamp: new Date().toISOString()
       });
     }
+
+    return res.status(200).json({
+      openaiKey,
+      timestamp: new Date().toISOString()
+    });
   });
 
   // Payment Methods endpoints
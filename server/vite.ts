@@ -2,13 +2,9 @@ import express, { type Express } from "express";
 import fs from "fs";
 import path, { dirname } from "path";
 import { fileURLToPath } from "url";
-import { createServer as createViteServer, createLogger } from "vite";
 const __filename = fileURLToPath(import.meta.url);
 const __dirname = dirname(__filename);
 import { type Server } from "http";
-import viteConfig from "../vite.config";
-
-const viteLogger = createLogger();
 
 export function log(message: string, source = "express") {
   const formattedTime = new Date().toLocaleTimeString("en-US", {
@@ -22,9 +18,15 @@ export function log(message: string, source = "express") {
 }
 
 export async function setupVite(app: Express, server: Server) {
+  // Vite is only used in development; import it on demand so the production
+  // server doesn't load the dev toolchain before it can bind its port. The
+  // config is loaded by Vite from disk rather than imported here, so the
+  // server bundle never pulls in vite.config or its plugins.
+  const { createServer: createViteServer, createLogger } = await import("vite");
+  const viteLogger = createLogger();
+
   const vite = await createViteServer({
-    ...viteConfig,
-    configFile: false,
+    configFile: path.resolve(__dirname, "..", "vite.config.ts"),
     customLogger: {
       ...viteLogger,
       error: (msg, options) => {
@@ -84,10 +86,29 @@ export function serveStatic(app: Express) {
     );
   }
 
-  app.use(express.static(distPath));
+  // Vite emits content-hashed filenames under /assets, so a given URL never
+  // changes and browsers can reuse it without revalidating
+  app.use(
+    "/assets",
+    express.static(path.resolve(distPath, "assets"), {
+      immutable: true,
+      maxAge: "1y",
+    }),
+  );
+
+  // Everything else (index.html, public files) keeps its URL across deploys,
+  // so it must be revalidated; the default ETag turns repeat loads into 304s
+  app.use(
+    express.static(distPath, {
+      setHeaders: (res) => {
+        res.setHeader("Cache-Control", "no-cache");
+      },
+    }),
+  );
 
   // fall through to index.html if the file doesn't exist
   app.use("*", (_req, res) => {
+    res.setHeader("Cache-Control", "no-cache");
     res.sendFile(path.resolve(distPath, "index.html"));
   });
 }